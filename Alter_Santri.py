@@ -3,11 +3,168 @@ from tkinter import filedialog, messagebox, ttk
 import os
 import pandas as pd
 from tkinter.font import Font
-from typing import Tuple, Optional, Dict
+from typing import Tuple, Optional, Dict, List, Sequence, Union
 import io
+import multiprocessing
+import multiprocessing.connection
+from contextlib import ExitStack
 from odf.opendocument import load
 
 
+class PlanilhaAberta:
+    """
+    Mantém uma planilha aberta para ler os cabeçalhos e depois os dados
+    do mesmo handle, sem abrir (e no ODS/XLS, sem reprocessar) o arquivo de novo.
+    """
+
+    def __init__(self, caminho: str, formato: str, skiprows: int = 0):
+        self.caminho = caminho
+        self.formato = formato
+        self.skiprows = skiprows
+        self.arquivo = None  # pd.ExcelFile (None para CSV)
+        self.encoding = None  # Codificação detectada do CSV
+
+    def __enter__(self):
+        if self.formato == 'excel':
+            try:
+                self.arquivo = pd.ExcelFile(self.caminho, engine='openpyxl')
+            except:
+                self.arquivo = pd.ExcelFile(self.caminho, engine='xlrd')
+        elif self.formato == 'ods':
+            self.arquivo = pd.ExcelFile(self.caminho, engine='odf')
+        elif self.formato != 'csv':
+            raise ValueError(f"Formato não suportado: {self.formato}")
+        return self
+
+    def __exit__(self, *args):
+        if self.arquivo is not None:
+            self.arquivo.close()
+
+    def _ler_csv(self, **kwargs) -> pd.DataFrame:
+        """Lê o CSV tentando a codificação já detectada primeiro"""
+        encodings = ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252']
+        if self.encoding:
+            encodings.remove(self.encoding)
+            encodings.insert(0, self.encoding)
+        for encoding in encodings:
+            try:
+                df = pd.read_csv(self.caminho, encoding=encoding, delimiter=None, engine='python', **kwargs)
+                self.encoding = encoding
+                return df
+            except UnicodeDecodeError:
+                continue
+        raise ValueError(f"UnicodeDecodeError em {os.path.basename(self.caminho)}")
+
+    def cabecalhos(self) -> Dict[Optional[str], List[str]]:
+        """Retorna as colunas de cada aba (CSV tem uma única aba, None)"""
+        if self.arquivo is None:
+            return {None: list(self._ler_csv(nrows=0).columns)}
+        return {
+            aba: list(self.arquivo.parse(aba, skiprows=self.skiprows, nrows=0).columns)
+            for aba in self.arquivo.sheet_names
+        }
+
+    def ler(self, aba: Optional[str], colunas: Sequence[str]) -> pd.DataFrame:
+        """Lê apenas as colunas informadas de uma aba"""
+        if self.arquivo is None:
+            return self._ler_csv(usecols=list(colunas))
+        return self.arquivo.parse(aba, skiprows=self.skiprows, usecols=list(colunas))
+
+
+def selecionar_abas(caminho: str, cabecalhos: Dict[Optional[str], List[str]],
+                    colunas_obrigatorias: Sequence[str]) -> Tuple[List[Optional[str]], List[Optional[str]]]:
+    """
+    Separa as abas que serão lidas das que serão ignoradas.
+
+    Só são ignoradas abas sem nenhuma das colunas obrigatórias (capa, resumo,
+    tabela dinâmica). Uma aba com parte das colunas é erro, pois seus dados
+    sumiriam da comparação sem aviso.
+
+    Returns:
+        Tupla (abas a ler, abas ignoradas)
+    """
+    nome = os.path.basename(caminho)
+    abas = []
+    ignoradas = []
+    for aba, colunas in cabecalhos.items():
+        colunas_faltantes = [col for col in colunas_obrigatorias if col not in colunas]
+        if not colunas_faltantes:
+            abas.append(aba)
+        elif len(colunas_faltantes) == len(colunas_obrigatorias):
+            ignoradas.append(aba)
+        else:
+            raise ValueError(
+                f"Colunas faltando em {nome}{f' (aba {aba})' if aba is not None else ''}:\n"
+                f"{', '.join(colunas_faltantes)}\n\n"
+                f"Colunas encontradas: {', '.join(map(str, colunas))}"
+            )
+
+    if not abas:
+        encontradas = next(iter(cabecalhos.values()), [])
+        raise ValueError(
+            f"Nenhuma aba de {nome} tem as colunas necessárias:\n"
+            f"{', '.join(colunas_obrigatorias)}\n\n"
+            f"Colunas encontradas: {', '.join(map(str, encontradas))}"
+        )
+    return abas, ignoradas
+
+
+def ler_em_processo(tarefas: Sequence[Tuple[str, str, int]], colunas_obrigatorias: Sequence[str],
+                    conexao) -> None:
+    """
+    Lê um grupo de planilhas em um processo separado, em duas etapas pela mesma conexão.
+
+    Abre todos os arquivos do grupo e envia os cabeçalhos de cada um. Depois
+    espera a lista de abas a ler de cada arquivo (None cancela) e só então
+    lê os dados, usando os mesmos arquivos já abertos.
+    """
+    caminho = None
+    try:
+        with ExitStack() as pilha:
+            planilhas = []
+            for caminho, formato, skiprows in tarefas:
+                planilha = pilha.enter_context(PlanilhaAberta(caminho, formato, skiprows))
+                conexao.send(('cabecalhos', planilha.cabecalhos()))
+                planilhas.append(planilha)
+
+            abas_por_arquivo = conexao.recv()
+            if abas_por_arquivo is None:
+                return
+            for planilha, abas in zip(planilhas, abas_por_arquivo):
+                caminho = planilha.caminho
+                conexao.send(('dados', [planilha.ler(aba, colunas_obrigatorias) for aba in abas]))
+    except Exception as e:
+        conexao.send(('erro', f"{os.path.basename(caminho or '')}: {e}"))
+    finally:
+        conexao.close()
+
+
+def receber(conexao, esperado: str):
+    """Recebe a resposta de um processo de leitura, convertendo erros em exceção"""
+    tipo, conteudo = conexao.recv()
+    if tipo == 'erro':
+        raise ValueError(conteudo)
+    if tipo != esperado:
+        raise ValueError(f"Resposta inesperada do processo de leitura: {tipo}")
+    return conteudo
+
+
+def receber_de_todos(pendentes: Dict, esperado: str, tratar) -> None:
+    """
+    Recebe uma resposta por arquivo, na ordem em que os processos terminam.
+
+    pendentes liga cada conexão aos índices dos arquivos que ela ainda vai
+    enviar; tratar(indice, conteudo) é chamado a cada resposta.
+    """
+    pendentes = {conexao: list(indices) for conexao, indices in pendentes.items()}
+    while pendentes:
+        for conexao in multiprocessing.connection.wait(list(pendentes)):
+            indice = pendentes[conexao].pop(0)
+            tratar(indice, receber(conexao, esperado))
+            if not pendentes[conexao]:
+                del pendentes[conexao]
+
+
 class ModernButton(tk.Canvas):
     """
     Classe personalizada para criar botões modernos com efeitos visuais.
@@ -105,6 +262,7 @@ class ComparadorPlanilhasApp:
         self.root = root
         self.planilha_alterdata = None  # Armazena a planilha ALTERDATA
         self.planilha_santri = None  # Armazena a planilha SANTRI
+        self.abas_ignoradas = []  # Abas sem as colunas esperadas na última leitura
         self.configurar_janela()
         self.criar_widgets()
 
@@ -299,41 +457,32 @@ class ComparadorPlanilhasApp:
                 else:
                     return 'csv'
 
-    def ler_arquivo(self, caminho: str, tipo: str) -> Optional[pd.DataFrame]:
+    def ler_arquivo(self, caminhos: Union[str, Sequence[str]], tipo: str) -> Optional[pd.DataFrame]:
         """
-        Lê um arquivo de planilha e verifica se contém as colunas necessárias.
+        Lê uma ou mais planilhas e junta em uma só tabela.
+
+        De cada arquivo são lidas as abas com todas as colunas esperadas. Abas
+        sem nenhuma delas (capa, resumo...) são ignoradas e ficam listadas em
+        self.abas_ignoradas; uma aba com só parte das colunas é erro.
+
+        Só arquivos diferentes são lidos em paralelo, em até os.cpu_count()
+        processos: as abas de um mesmo arquivo são lidas uma após a outra,
+        do mesmo arquivo aberto. Primeiro todos os cabeçalhos são validados
+        e só então os dados são lidos; qualquer erro interrompe os processos
+        antes da leitura completa.
 
         Args:
-            caminho: Caminho do arquivo
+            caminhos: Caminho do arquivo ou lista de caminhos
             tipo: Tipo da planilha ('ALTERDATA' ou 'SANTRI')
 
         Returns:
             DataFrame com os dados ou None em caso de erro
         """
-        try:
-            formato = self.detectar_formato_arquivo(caminho)
-
-            # Lê o arquivo conforme o formato detectado
-            if formato == 'excel':
-                try:
-                    skiprows = 0 if tipo == 'ALTERDATA' else 4
-                    df = pd.read_excel(caminho, engine='openpyxl', skiprows=skiprows)
-                except:
-                    df = pd.read_excel(caminho, engine='xlrd', skiprows=skiprows)
-            elif formato == 'csv':
-                # Tenta diferentes codificações para CSV
-                encodings = ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252']
-                for encoding in encodings:
-                    try:
-                        df = pd.read_csv(caminho, encoding=encoding, delimiter=None, engine='python')
-                        break
-                    except UnicodeDecodeError:
-                        continue
-            elif formato == 'ods':
-                df = pd.read_excel(caminho, engine='odf')
-            else:
-                raise ValueError(f"Formato não suportado: {formato}")
+        if isinstance(caminhos, str):
+            caminhos = [caminhos]
+        self.abas_ignoradas = []
 
+        try:
             # Verifica se o tipo é ALTERDATA ou SANTRI
             tipo_planilha = tipo.split()[0].upper()
             config = self.colunas_esperadas.get(tipo_planilha, {})
@@ -341,18 +490,31 @@ class ComparadorPlanilhasApp:
             if not config:
                 raise ValueError(f"Tipo de planilha desconhecido: {tipo}")
 
-            # Verifica colunas obrigatórias
             colunas_obrigatorias = config['colunas_originais']
-            colunas_faltantes = [col for col in colunas_obrigatorias if col not in df.columns]
 
-            if colunas_faltantes:
-                raise ValueError(
-                    f"Colunas faltando na planilha {tipo}:\n"
-                    f"{', '.join(colunas_faltantes)}\n\n"
-                    f"Colunas encontradas: {', '.join(df.columns)}"
-                )
+            # Monta a lista de arquivos a ler: (caminho, formato, skiprows)
+            tarefas = []
+            for caminho in caminhos:
+                formato = self.detectar_formato_arquivo(caminho)
+                skiprows = 4 if formato == 'excel' and tipo_planilha == 'SANTRI' else 0
+                tarefas.append((caminho, formato, skiprows))
+
+            processos = min(os.cpu_count() or 1, len(tarefas))
+            if processos == 1:
+                partes = []
+                with ExitStack() as pilha:
+                    planilhas = [pilha.enter_context(PlanilhaAberta(*t)) for t in tarefas]
+                    abas_por_arquivo = [self.escolher_abas(p.caminho, p.cabecalhos(), colunas_obrigatorias)
+                                        for p in planilhas]
+                    for planilha, abas in zip(planilhas, abas_por_arquivo):
+                        partes.extend(planilha.ler(aba, colunas_obrigatorias) for aba in abas)
+            else:
+                partes = self.ler_em_paralelo(tarefas, colunas_obrigatorias, processos)
 
-            return df
+            # Mantém a ordem dos arquivos e abas na tabela final
+            if len(partes) == 1:
+                return partes[0]
+            return pd.concat(partes, ignore_index=True)
 
         except Exception as e:
             # Tratamento de erros específicos
@@ -366,10 +528,80 @@ class ComparadorPlanilhasApp:
             messagebox.showerror("Erro", f"Erro ao ler {tipo}:\n{erro_msg}")
             return None
 
+    def escolher_abas(self, caminho: str, cabecalhos: Dict[Optional[str], List[str]],
+                      colunas_obrigatorias: Sequence[str]) -> List[Optional[str]]:
+        """Escolhe as abas de um arquivo e registra as ignoradas para mostrar ao usuário"""
+        abas, ignoradas = selecionar_abas(caminho, cabecalhos, colunas_obrigatorias)
+        nome = os.path.basename(caminho)
+        self.abas_ignoradas.extend(f"{nome} ({aba})" for aba in ignoradas)
+        return abas
+
+    def ler_em_paralelo(self, tarefas: List[Tuple[str, str, int]], colunas_obrigatorias: Sequence[str],
+                        processos: int) -> List[pd.DataFrame]:
+        """
+        Lê vários arquivos divididos entre no máximo `processos` processos.
+
+        Cada processo mantém seus arquivos abertos entre a validação dos
+        cabeçalhos e a leitura dos dados, para não abrir nenhum duas vezes.
+        """
+        grupos = [list(range(i, len(tarefas), processos)) for i in range(processos)]
+        filhos = []
+        pendentes = {}
+        concluido = False
+        try:
+            for indices in grupos:
+                conexao, conexao_filho = multiprocessing.Pipe()
+                processo = multiprocessing.Process(
+                    target=ler_em_processo,
+                    args=([tarefas[i] for i in indices], colunas_obrigatorias, conexao_filho),
+                    daemon=True
+                )
+                processo.start()
+                conexao_filho.close()
+                filhos.append((processo, conexao))
+                pendentes[conexao] = indices
+
+            # Etapa 1: cada cabeçalho é validado assim que chega; todos precisam
+            # passar antes de qualquer leitura de dados
+            abas_por_arquivo = [None] * len(tarefas)
+
+            def validar(indice, cabecalhos):
+                abas_por_arquivo[indice] = self.escolher_abas(tarefas[indice][0], cabecalhos,
+                                                              colunas_obrigatorias)
+
+            receber_de_todos(pendentes, 'cabecalhos', validar)
+
+            # Etapa 2: cada processo lê as abas escolhidas dos arquivos já abertos
+            for conexao, indices in pendentes.items():
+                conexao.send([abas_por_arquivo[i] for i in indices])
+            partes_por_arquivo = [None] * len(tarefas)
+
+            def guardar(indice, partes):
+                partes_por_arquivo[indice] = partes
+
+            receber_de_todos(pendentes, 'dados', guardar)
+            concluido = True
+            return [parte for partes in partes_por_arquivo for parte in partes]
+        finally:
+            for processo, conexao in filhos:
+                # Em caso de erro não espera leituras que ainda estão em andamento
+                if not concluido:
+                    processo.terminate()
+                processo.join()
+                conexao.close()
+
+    def status_planilha(self, rotulo: str, caminhos: Sequence[str]) -> str:
+        """Texto do status de uma planilha carregada, incluindo as abas ignoradas"""
+        nome = os.path.basename(caminhos[0]) if len(caminhos) == 1 else f"{len(caminhos)} arquivos"
+        texto = f"✓ Planilha {rotulo}: {nome}"
+        if self.abas_ignoradas:
+            texto += f"  (abas ignoradas: {', '.join(self.abas_ignoradas)})"
+        return texto
+
     def carregar_alterdata(self):
-        """Abre diálogo para selecionar e carregar planilha ALTERDATA"""
-        arquivo = filedialog.askopenfilename(
-            title="Selecione a planilha ALTERDATA",
+        """Abre diálogo para selecionar e carregar uma ou mais planilhas ALTERDATA"""
+        arquivos = filedialog.askopenfilenames(
+            title="Selecione a(s) planilha(s) ALTERDATA",
             filetypes=[
                 ("Planilhas Excel", "*.xlsx *.xls"),
                 ("Arquivos CSV", "*.csv"),
@@ -377,19 +609,18 @@ class ComparadorPlanilhasApp:
                 ("Todos os arquivos", "*.*")
             ]
         )
-        if arquivo:
-            self.planilha_alterdata = self.ler_arquivo(arquivo, "ALTERDATA")
+        if arquivos:
+            self.planilha_alterdata = self.ler_arquivo(arquivos, "ALTERDATA")
             if self.planilha_alterdata is not None:
-                nome = os.path.basename(arquivo)
-                self.label_alterdata.config(text=f"✓ Planilha ALTERDATA: {nome}", fg="#28A745")
+                self.label_alterdata.config(text=self.status_planilha("ALTERDATA", arquivos), fg="#28A745")
                 self.verificar_arquivos_carregados()
             else:
                 self.label_alterdata.config(text=f"✗ Erro ao carregar ALTERDATA", fg="#C70909")
 
     def carregar_santri(self):
-        """Abre diálogo para selecionar e carregar planilha SANTRI"""
-        arquivo = filedialog.askopenfilename(
-            title="Selecione a planilha SANTRI ADM",
+        """Abre diálogo para selecionar e carregar uma ou mais planilhas SANTRI"""
+        arquivos = filedialog.askopenfilenames(
+            title="Selecione a(s) planilha(s) SANTRI ADM",
             filetypes=[
                 ("Planilhas Excel", "*.xlsx *.xls"),
                 ("Arquivos CSV", "*.csv"),
@@ -397,11 +628,10 @@ class ComparadorPlanilhasApp:
                 ("Todos os arquivos", "*.*")
             ]
         )
-        if arquivo:
-            self.planilha_santri = self.ler_arquivo(arquivo, "SANTRI ADM")
+        if arquivos:
+            self.planilha_santri = self.ler_arquivo(arquivos, "SANTRI ADM")
             if self.planilha_santri is not None:
-                nome = os.path.basename(arquivo)
-                self.label_santri.config(text=f"✓ Planilha SANTRI ADM: {nome}", fg="#28A745")
+                self.label_santri.config(text=self.status_planilha("SANTRI ADM", arquivos), fg="#28A745")
                 self.verificar_arquivos_carregados()
             else:
                 self.label_santri.config(text=f"✗ Erro ao carregar SANTRI", fg="#C70909")
@@ -0,0 +1,173 @@
+import argparse
+import os
+import struct
+import time
+
+import numpy as np
+import pandas as pd
+
+# Tamanho padrão do bloco processado de cada vez (quantidade de números)
+TAMANHO_BLOCO = 4_000_000
+
+# Tamanho reservado para o cabeçalho de cada coluna .npy (múltiplo de 64)
+TAMANHO_CABECALHO = 128
+
+# Colunas geradas pela análise e o tipo de cada uma
+COLUNAS = {
+    'numero': np.int64,
+    'unidade': np.int8,      # ex023.py
+    'dezena': np.int8,
+    'centena': np.int8,
+    'milhar': np.int8,
+    'par': np.bool_,         # par_or_impar.py / ex030.py
+    'sucessor': np.int64,    # numerosint.py
+    'antecessor': np.int64,
+    'raiz': np.float64,      # md.py
+    'dobro': np.int64,       # ex06.py
+    'triplo': np.int64,
+}
+
+
+def analisar_bloco(numeros: np.ndarray) -> dict:
+    """
+    Calcula todas as propriedades de um bloco de números de uma só vez.
+
+    Args:
+        numeros: Array de inteiros
+
+    Returns:
+        Dicionário com um array por coluna de COLUNAS
+    """
+    numeros = np.asarray(numeros, dtype=np.int64)
+    # Raiz de número negativo vira NaN em vez de interromper o lote
+    with np.errstate(invalid='ignore'):
+        raiz = np.sqrt(numeros)
+    return {
+        'numero': numeros,
+        'unidade': numeros // 1 % 10,
+        'dezena': numeros // 10 % 10,
+        'centena': numeros // 100 % 10,
+        'milhar': numeros // 1000 % 10,
+        'par': numeros % 2 == 0,
+        'sucessor': numeros + 1,
+        'antecessor': numeros - 1,
+        'raiz': raiz,
+        'dobro': numeros * 2,
+        'triplo': numeros * 3,
+    }
+
+
+def ler_blocos_texto(caminho: str, tamanho_bloco: int):
+    """
+    Lê um arquivo texto (um inteiro por linha) em blocos de tamanho fixo.
+
+    A conversão é feita pelo leitor em C do pandas, uma vez por bloco.
+    Linhas vazias ou só com espaços são ignoradas.
+    """
+    blocos = pd.read_csv(caminho, header=None, names=['numero'], sep=r'\s+', dtype=np.int64,
+                         skip_blank_lines=True, chunksize=tamanho_bloco)
+    for bloco in blocos:
+        yield bloco['numero'].to_numpy()
+
+
+def abrir_entrada(caminho: str, tamanho_bloco: int):
+    """
+    Abre o arquivo de entrada conforme a extensão.
+
+    Aceita .npy (mapeado em memória), .bin (int64 bruto, mapeado em memória)
+    e qualquer outro formato como texto com um inteiro por linha.
+
+    Returns:
+        Gerador de blocos de números
+    """
+    extensao = os.path.splitext(caminho)[1].lower()
+
+    if extensao in ('.npy', '.bin'):
+        if extensao == '.npy':
+            dados = np.load(caminho, mmap_mode='r')
+        else:
+            dados = np.memmap(caminho, dtype=np.int64, mode='r')
+        if dados.ndim != 1 or dados.dtype.kind not in 'iu':
+            raise ValueError(f"Arquivo {caminho} não é um vetor de inteiros")
+        return (dados[i:i + tamanho_bloco] for i in range(0, len(dados), tamanho_bloco))
+
+    return ler_blocos_texto(caminho, tamanho_bloco)
+
+
+def _cabecalho_npy(tipo, quantidade: int) -> bytes:
+    """
+    Monta o cabeçalho .npy (versão 1.0) de um vetor, sempre com TAMANHO_CABECALHO bytes.
+
+    Com tamanho fixo o cabeçalho pode ser regravado no fim, quando a
+    quantidade de números já é conhecida, sem mover os dados.
+    """
+    descricao = repr({
+        'descr': np.lib.format.dtype_to_descr(np.dtype(tipo)),
+        'fortran_order': False,
+        'shape': (quantidade,),
+    })
+    # 6 bytes de assinatura, 2 de versão e 2 do tamanho do cabeçalho
+    corpo = descricao.ljust(TAMANHO_CABECALHO - 10 - 1) + '\n'
+    return b'\x93NUMPY\x01\x00' + struct.pack('<H', len(corpo)) + corpo.encode('latin1')
+
+
+def analisar_arquivo(entrada: str, pasta_saida: str, tamanho_bloco: int = TAMANHO_BLOCO) -> int:
+    """
+    Analisa um arquivo grande de inteiros e grava o resultado em colunas.
+
+    Cada coluna vira um arquivo .npy dentro de pasta_saida, que pode ser
+    aberto depois com np.load(..., mmap_mode='r'). Os blocos são acrescentados
+    ao fim de cada coluna, então a entrada é lida uma única vez.
+
+    Args:
+        entrada: Caminho do arquivo de inteiros
+        pasta_saida: Pasta onde as colunas serão gravadas
+        tamanho_bloco: Quantidade de números processados por vez
+
+    Returns:
+        Quantidade de números analisados
+    """
+    blocos = abrir_entrada(entrada, tamanho_bloco)
+    os.makedirs(pasta_saida, exist_ok=True)
+
+    caminhos = {nome: os.path.join(pasta_saida, f"{nome}.npy") for nome in COLUNAS}
+    saidas = {}
+    total = 0
+    try:
+        for nome, tipo in COLUNAS.items():
+            saidas[nome] = open(caminhos[nome], 'wb')
+            saidas[nome].write(_cabecalho_npy(tipo, 0))
+
+        for bloco in blocos:
+            for nome, valores in analisar_bloco(bloco).items():
+                np.asarray(valores, dtype=COLUNAS[nome]).tofile(saidas[nome])
+            total += len(bloco)
+
+        # Agora que a quantidade é conhecida, corrige o cabeçalho de cada coluna
+        for nome, tipo in COLUNAS.items():
+            saidas[nome].seek(0)
+            saidas[nome].write(_cabecalho_npy(tipo, total))
+    except Exception:
+        # Não deixa colunas incompletas na pasta de saída
+        for nome, arquivo in saidas.items():
+            arquivo.close()
+            os.remove(caminhos[nome])
+        raise
+
+    for arquivo in saidas.values():
+        arquivo.close()
+    return total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Análise de números em lote")
+    parser.add_argument('entrada', help="Arquivo .npy, .bin (int64) ou texto com um número por linha")
+    parser.add_argument('saida', help="Pasta onde as colunas .npy serão gravadas")
+    parser.add_argument('--bloco', type=int, default=TAMANHO_BLOCO, help="Números por bloco")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    quantidade = analisar_arquivo(args.entrada, args.saida, args.bloco)
+    tempo = time.perf_counter() - inicio
+    print('Analisados {} numeros em {:.2f} s ({:.0f} numeros/s)'.format(
+        quantidade, tempo, quantidade / tempo if tempo else 0))
@@ -0,0 +1,179 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Mesma nota de corte do notas.py
+MEDIA_APROVACAO = 6.0
+
+# Linhas lidas de cada vez de um arquivo de turma
+TAMANHO_BLOCO = 500_000
+
+PERCENTIS = (25, 75, 90)
+
+
+def calcular_medias(notas: np.ndarray, pesos: Optional[Sequence[float]] = None) -> np.ndarray:
+    """
+    Calcula a média ponderada de cada aluno (uma linha por aluno, uma coluna por nota).
+
+    Sem pesos todas as notas valem o mesmo, ou seja (n1 + n2) / 2 como no
+    notas.py e no ex07.py.
+    """
+    notas = np.asarray(notas, dtype=np.float64)
+    if pesos is None:
+        return notas.mean(axis=1)
+
+    pesos = np.asarray(pesos, dtype=np.float64)
+    if pesos.shape != (notas.shape[1],):
+        raise ValueError(f"Esperados {notas.shape[1]} pesos, recebidos {len(pesos)}")
+    if pesos.sum() <= 0:
+        raise ValueError("A soma dos pesos deve ser maior que zero")
+    return notas @ pesos / pesos.sum()
+
+
+def processar_arquivo(caminho: str, colunas_notas: Optional[List[str]] = None,
+                      pesos: Optional[Sequence[float]] = None, pasta_saida: Optional[str] = None,
+                      tamanho_bloco: int = TAMANHO_BLOCO) -> Dict[str, np.ndarray]:
+    """
+    Lê um arquivo CSV de turma em blocos e calcula a média de cada aluno.
+
+    O arquivo deve ter uma coluna por nota (por padrão as que começam com
+    'nota'). Se não houver coluna 'turma', o nome do arquivo é usado.
+
+    Args:
+        caminho: Caminho do CSV
+        colunas_notas: Colunas com as notas, na mesma ordem dos pesos
+        pesos: Peso de cada nota
+        pasta_saida: Se informada, grava a média e a situação de cada aluno
+            (situação vazia para quem tem nota inválida)
+        tamanho_bloco: Quantidade de linhas lidas por vez
+
+    Returns:
+        Dicionário turma -> array com as médias dos alunos
+    """
+    if colunas_notas is None:
+        cabecalho = pd.read_csv(caminho, nrows=0).columns
+        colunas_notas = [col for col in cabecalho if str(col).lower().startswith('nota')]
+    if not colunas_notas:
+        raise ValueError(f"Nenhuma coluna de nota encontrada em {caminho}")
+
+    turma_padrao = os.path.splitext(os.path.basename(caminho))[0]
+    medias_por_turma: Dict[str, List[np.ndarray]] = {}
+    saida = None
+    if pasta_saida:
+        os.makedirs(pasta_saida, exist_ok=True)
+        saida = os.path.join(pasta_saida, f"{turma_padrao}_resultado.csv")
+
+    blocos = pd.read_csv(caminho, chunksize=tamanho_bloco)
+    for numero_bloco, bloco in enumerate(blocos):
+        faltantes = [col for col in colunas_notas if col not in bloco.columns]
+        if faltantes:
+            raise ValueError(f"Colunas faltando em {caminho}: {', '.join(faltantes)}")
+
+        notas = bloco[colunas_notas].apply(pd.to_numeric, errors='coerce').to_numpy()
+        medias = calcular_medias(notas, pesos)
+
+        if 'turma' in bloco.columns:
+            turmas = bloco['turma'].astype(str).to_numpy()
+        else:
+            turmas = np.full(len(bloco), turma_padrao, dtype=object)
+
+        # Agrupa as médias do bloco por turma sem laço por aluno
+        codigos, nomes = pd.factorize(turmas)
+        ordem = np.argsort(codigos, kind='stable')
+        limites = np.searchsorted(codigos[ordem], np.arange(1, len(nomes)))
+        for turma, grupo in zip(nomes, np.split(medias[ordem], limites)):
+            medias_por_turma.setdefault(turma, []).append(grupo)
+
+        if saida:
+            resultado = pd.DataFrame({
+                'aluno': bloco['aluno'] if 'aluno' in bloco.columns else bloco.index,
+                'turma': turmas,
+                'media': medias.round(1),
+                # Aluno sem média válida fica sem situação, como no resumo
+                'aprovado': pd.array(np.where(np.isnan(medias), None, medias >= MEDIA_APROVACAO),
+                                     dtype='boolean'),
+            })
+            resultado.to_csv(saida, mode='w' if numero_bloco == 0 else 'a',
+                             header=numero_bloco == 0, index=False)
+
+    return {turma: np.concatenate(grupos) for turma, grupos in medias_por_turma.items()}
+
+
+def resumir_turmas(medias_por_turma: Dict[str, np.ndarray],
+                   percentis: Sequence[float] = PERCENTIS) -> pd.DataFrame:
+    """Calcula média, mediana, percentis e aprovação de cada turma"""
+    linhas = []
+    for turma, medias in sorted(medias_por_turma.items()):
+        validas = medias[~np.isnan(medias)]
+        linha = {'turma': turma, 'alunos': len(medias), 'sem_nota': len(medias) - len(validas)}
+        if len(validas):
+            linha['media'] = validas.mean()
+            linha['mediana'] = np.median(validas)
+            for p, valor in zip(percentis, np.percentile(validas, percentis)):
+                linha[f'p{p:g}'] = valor
+            aprovados = int((validas >= MEDIA_APROVACAO).sum())
+            linha['aprovados'] = aprovados
+            linha['taxa_aprovacao'] = aprovados / len(validas)
+        linhas.append(linha)
+    return pd.DataFrame(linhas)
+
+
+def processar_arquivos(caminhos: Sequence[str], colunas_notas: Optional[List[str]] = None,
+                       pesos: Optional[Sequence[float]] = None, pasta_saida: Optional[str] = None,
+                       processos: int = 1) -> Tuple[pd.DataFrame, int, float]:
+    """
+    Processa vários arquivos de turma, em paralelo se processos > 1.
+
+    Os arquivos precisam ter nomes distintos, pois o nome vira a turma
+    padrão e o nome do arquivo de resultado.
+
+    Returns:
+        Tupla (resumo por turma, quantidade de alunos, tempo em segundos)
+    """
+    nomes: Dict[str, List[str]] = {}
+    for caminho in caminhos:
+        nome = os.path.splitext(os.path.basename(caminho))[0].lower()
+        nomes.setdefault(nome, []).append(caminho)
+    repetidos = [c for grupo in nomes.values() if len(grupo) > 1 for c in grupo]
+    if repetidos:
+        raise ValueError(f"Arquivos com o mesmo nome: {', '.join(repetidos)}")
+
+    inicio = time.perf_counter()
+    argumentos = [(c, colunas_notas, pesos, pasta_saida) for c in caminhos]
+
+    if processos > 1 and len(caminhos) > 1:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            resultados = list(executor.map(processar_arquivo, *zip(*argumentos)))
+    else:
+        resultados = [processar_arquivo(*a) for a in argumentos]
+
+    # Uma turma pode estar espalhada em mais de um arquivo
+    medias_por_turma: Dict[str, List[np.ndarray]] = {}
+    for resultado in resultados:
+        for turma, medias in resultado.items():
+            medias_por_turma.setdefault(turma, []).append(medias)
+    medias_por_turma = {t: np.concatenate(m) for t, m in medias_por_turma.items()}
+
+    total = sum(len(m) for m in medias_por_turma.values())
+    return resumir_turmas(medias_por_turma), total, time.perf_counter() - inicio
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Boletim em lote: médias e aprovação por turma")
+    parser.add_argument('arquivos', nargs='+', help="Arquivos CSV das turmas")
+    parser.add_argument('--notas', nargs='+', help="Colunas de notas (padrão: colunas 'nota*')")
+    parser.add_argument('--pesos', nargs='+', type=float, help="Peso de cada nota")
+    parser.add_argument('--saida', help="Pasta para gravar o resultado de cada aluno")
+    parser.add_argument('--processos', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    resumo, alunos, tempo = processar_arquivos(args.arquivos, args.notas, args.pesos,
+                                               args.saida, args.processos)
+    print(resumo.to_string(index=False, float_format='{:.2f}'.format))
+    print('{} alunos em {} arquivos em {:.2f} s ({:.0f} alunos/s)'.format(
+        alunos, len(args.arquivos), tempo, alunos / tempo if tempo else 0))
@@ -0,0 +1,202 @@
+import argparse
+import time
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Cotações fixas do ex010.py, em reais por unidade da moeda
+TAXAS_PADRAO = {
+    'USD': 5.84,
+    'EUR': 6.41,
+    'CNY': 0.80,
+    'JPY': 25.0,
+}
+
+MOEDA_BASE = 'BRL'
+
+# Linhas lidas de cada vez de um arquivo de lançamentos
+TAMANHO_BLOCO = 1_000_000
+
+# Formato das datas nos arquivos (use '%d/%m/%Y' para datas brasileiras)
+FORMATO_DATA = '%Y-%m-%d'
+
+# Data usada para tabelas sem data (valem para qualquer dia)
+SEM_DATA = np.datetime64('1900-01-01', 'D')
+
+
+class TabelaCambio:
+    """
+    Tabela de cotações indexada por moeda e data, mantida em memória.
+
+    Para cada moeda guarda um array ordenado de datas e outro de taxas (em
+    reais por unidade da moeda). A taxa de um dia é a última cotação
+    publicada até aquele dia.
+    """
+
+    def __init__(self, cotacoes: Dict[str, Tuple[np.ndarray, np.ndarray]], tamanho_cache: int = 65536):
+        self.cotacoes = {}
+        for moeda, (datas, taxas) in cotacoes.items():
+            datas = np.asarray(datas, dtype='datetime64[D]')
+            taxas = np.asarray(taxas, dtype=np.float64)
+            ordem = np.argsort(datas, kind='stable')
+            self.cotacoes[moeda.upper()] = (datas[ordem], taxas[ordem])
+        self.cotacoes[MOEDA_BASE] = (np.array([SEM_DATA]), np.array([1.0]))
+
+        # Cache das consultas individuais (moeda, data)
+        self.taxa = lru_cache(maxsize=tamanho_cache)(self._taxa)
+
+    @classmethod
+    def padrao(cls) -> 'TabelaCambio':
+        """Tabela com as cotações fixas do ex010.py, válidas para qualquer data"""
+        return cls({moeda: ([SEM_DATA], [taxa]) for moeda, taxa in TAXAS_PADRAO.items()})
+
+    @classmethod
+    def de_arquivos(cls, caminhos: Sequence[str], formato_data: str = FORMATO_DATA,
+                    **kwargs) -> 'TabelaCambio':
+        """
+        Carrega cotações de arquivos CSV com as colunas 'data', 'moeda' e 'taxa'.
+
+        A taxa é em reais por unidade da moeda, como no ex010.py. Todas as
+        datas precisam estar no formato formato_data.
+        """
+        tabela = pd.concat(
+            [pd.read_csv(c, usecols=['data', 'moeda', 'taxa'], dtype={'data': str}) for c in caminhos],
+            ignore_index=True
+        )
+        datas = pd.to_datetime(tabela['data'], format=formato_data, errors='coerce')
+        invalidas = tabela.loc[datas.isna(), 'data']
+        if len(invalidas):
+            raise ValueError(
+                f"Datas fora do formato {formato_data} nas cotações: {', '.join(map(str, invalidas[:5]))}"
+            )
+        tabela['data'] = datas
+        tabela['moeda'] = tabela['moeda'].astype(str).str.strip().str.upper()
+        cotacoes = {
+            moeda: (grupo['data'].to_numpy(dtype='datetime64[D]'), grupo['taxa'].to_numpy(dtype=np.float64))
+            for moeda, grupo in tabela.groupby('moeda')
+        }
+        return cls(cotacoes, **kwargs)
+
+    def _taxa(self, moeda: str, data=None) -> float:
+        """Taxa de uma moeda em uma data (NaN se a moeda não existe ou não há cotação até a data)"""
+        if moeda.upper() not in self.cotacoes:
+            return float('nan')
+        datas, taxas = self.cotacoes[moeda.upper()]
+        if data is None:
+            return float(taxas[-1])
+        data = np.datetime64(data, 'D')
+        if np.isnat(data):
+            return float('nan')
+        posicao = np.searchsorted(datas, data, side='right') - 1
+        return float(taxas[posicao]) if posicao >= 0 else float('nan')
+
+    def taxas(self, moedas: np.ndarray, datas: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Taxas de vários lançamentos de uma vez, com uma busca por moeda distinta.
+
+        Moedas desconhecidas e datas vazias (NaT) ficam com taxa NaN.
+        """
+        moedas = np.asarray(moedas)
+        resultado = np.full(len(moedas), np.nan)
+        if datas is not None:
+            datas = np.asarray(datas, dtype='datetime64[D]')
+
+        codigos, unicas = pd.factorize(moedas)
+        for codigo, moeda in enumerate(unicas):
+            moeda = str(moeda).upper()
+            if moeda not in self.cotacoes:
+                continue
+            selecao = codigos == codigo
+            datas_moeda, taxas_moeda = self.cotacoes[moeda]
+            if datas is None:
+                resultado[selecao] = taxas_moeda[-1]
+                continue
+            datas_selecao = datas[selecao]
+            posicoes = np.searchsorted(datas_moeda, datas_selecao, side='right') - 1
+            # NaT fica depois de todas as datas na busca; sem data não há taxa
+            encontradas = (posicoes >= 0) & ~np.isnat(datas_selecao)
+            taxas_selecao = np.full(len(posicoes), np.nan)
+            taxas_selecao[encontradas] = taxas_moeda[posicoes[encontradas]]
+            resultado[selecao] = taxas_selecao
+        return resultado
+
+    def converter(self, valores: np.ndarray, moedas, datas: Optional[np.ndarray] = None,
+                  para: str = MOEDA_BASE) -> np.ndarray:
+        """
+        Converte um array de valores de uma só vez.
+
+        Args:
+            valores: Valores na moeda de origem
+            moedas: Moeda de cada valor, ou uma só moeda para todos
+            datas: Data de cada valor (None usa a cotação mais recente)
+            para: Moeda de destino
+
+        Returns:
+            Array com os valores convertidos (NaN onde não há cotação)
+        """
+        if para.upper() not in self.cotacoes:
+            raise ValueError(f"Moeda de destino sem cotação: {para}")
+        valores = np.asarray(valores, dtype=np.float64)
+        if isinstance(moedas, str):
+            moedas = np.full(len(valores), moedas, dtype=object)
+
+        em_reais = valores * self.taxas(moedas, datas)
+        if para.upper() == MOEDA_BASE:
+            return em_reais
+        destino = np.full(len(valores), para, dtype=object)
+        return em_reais / self.taxas(destino, datas)
+
+    def converter_arquivo(self, entrada: str, saida: str, para: str = MOEDA_BASE,
+                          tamanho_bloco: int = TAMANHO_BLOCO, formato_data: str = FORMATO_DATA) -> int:
+        """
+        Converte um arquivo CSV de lançamentos em blocos.
+
+        O arquivo deve ter as colunas 'valor' e 'moeda', e opcionalmente 'data'
+        (no formato formato_data). A saída repete as colunas e acrescenta
+        'valor_<moeda de destino>', vazio quando não há cotação.
+
+        Returns:
+            Quantidade de lançamentos convertidos
+        """
+        if para.upper() not in self.cotacoes:
+            raise ValueError(f"Moeda de destino sem cotação: {para}")
+
+        total = 0
+        blocos = pd.read_csv(entrada, chunksize=tamanho_bloco, dtype={'data': str})
+        for numero_bloco, bloco in enumerate(blocos):
+            datas = None
+            if 'data' in bloco.columns:
+                datas = pd.to_datetime(bloco['data'], format=formato_data, errors='coerce').to_numpy()
+            bloco[f'valor_{para.lower()}'] = self.converter(
+                pd.to_numeric(bloco['valor'], errors='coerce').to_numpy(),
+                bloco['moeda'].astype(str).str.strip().str.upper().to_numpy(),
+                datas,
+                para
+            )
+            bloco.to_csv(saida, mode='w' if numero_bloco == 0 else 'a',
+                         header=numero_bloco == 0, index=False)
+            total += len(bloco)
+        return total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Conversão de moedas em lote")
+    parser.add_argument('entrada', help="CSV de lançamentos com colunas valor, moeda e data")
+    parser.add_argument('saida', help="CSV de saída")
+    parser.add_argument('--cotacoes', nargs='+', help="CSVs de cotações (padrão: taxas do ex010.py)")
+    parser.add_argument('--para', default=MOEDA_BASE, help="Moeda de destino")
+    parser.add_argument('--formato-data', default=FORMATO_DATA, help="Formato das datas, ex.: %%d/%%m/%%Y")
+    args = parser.parse_args()
+
+    if args.cotacoes:
+        tabela = TabelaCambio.de_arquivos(args.cotacoes, args.formato_data)
+    else:
+        tabela = TabelaCambio.padrao()
+    inicio = time.perf_counter()
+    quantidade = tabela.converter_arquivo(args.entrada, args.saida, args.para,
+                                          formato_data=args.formato_data)
+    tempo = time.perf_counter() - inicio
+    print('Convertidos {} lancamentos em {:.2f} s ({:.0f} lancamentos/s)'.format(
+        quantidade, tempo, quantidade / tempo if tempo else 0))
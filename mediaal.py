@@ -1,5 +1,5 @@
 n1 = int(input('Qual Foi sua nota Do Primeiro Bimestre: '))
 n2 = int(input('Qual foi sua nota Do Segundo Bimestre: '))
 s = n1 + n2 
-m = s / 4
+m = s / 2
 print('Sua media Bimestral e: {}'.format(m))
\ No newline at end of file
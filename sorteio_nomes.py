@@ -0,0 +1,279 @@
+import argparse
+import math
+import os
+import random
+import shutil
+import tempfile
+import time
+import sys
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Optional, Tuple
+
+try:
+    import resource  # Só existe em Unix; usado para medir os processos filhos
+except ImportError:
+    resource = None
+
+# Memória máxima (em bytes) que cada processo usa para embaralhar um balde
+MEMORIA_BALDE = 256 * 1024 * 1024
+
+# Custo aproximado (em bytes) de cada nome na memória além do próprio texto:
+# objeto str do Python mais o ponteiro na lista do readlines()
+CUSTO_POR_NOME = 64
+
+# Máximo de baldes abertos ao mesmo tempo; baldes ainda grandes demais são
+# divididos de novo em uma nova passada
+MAX_BALDES = 256
+
+
+def ler_nomes(caminho: str):
+    """Lê os nomes de um arquivo texto, um por linha, sem carregá-lo inteiro"""
+    with open(caminho, encoding='utf-8') as f:
+        for linha in f:
+            nome = linha.strip()
+            if nome:
+                yield nome
+
+
+def sortear(nomes, k: int, semente: int = None) -> list:
+    """
+    Sorteia k nomes de uma sequência de tamanho desconhecido (amostragem por reservatório).
+
+    Usa o Algoritmo L, que pula direto para o próximo nome substituído em vez
+    de gerar um número aleatório por nome. Com k=1 equivale ao choice do ex018.py.
+
+    Args:
+        nomes: Iterável de nomes (pode ser um gerador de arquivo)
+        k: Quantidade de nomes a sortear
+        semente: Semente do gerador aleatório, para resultados reproduzíveis
+
+    Returns:
+        Lista com até k nomes sorteados
+    """
+    if k <= 0:
+        raise ValueError("A quantidade de nomes sorteados deve ser maior que zero")
+
+    aleatorio = random.Random(semente)
+    nomes = iter(nomes)
+    reservatorio = list(islice(nomes, k))
+
+    # Com menos de k nomes todos são escolhidos
+    if len(reservatorio) == k:
+        fim = object()
+        w = math.exp(math.log(aleatorio.random()) / k)
+        while True:
+            pulo = math.floor(math.log(aleatorio.random()) / math.log(1 - w))
+            nome = next(islice(nomes, pulo, None), fim)
+            if nome is fim:
+                break
+            reservatorio[aleatorio.randrange(k)] = nome
+            w *= math.exp(math.log(aleatorio.random()) / k)
+
+    # A ordem do resultado não pode depender de quantos nomes havia
+    aleatorio.shuffle(reservatorio)
+    return reservatorio
+
+
+def _fator_memoria(caminho: str) -> float:
+    """
+    Estima quantas vezes um balde ocupa mais memória do que em disco.
+
+    Usa o tamanho médio das linhas no começo do arquivo: nomes curtos
+    custam proporcionalmente mais, pelo CUSTO_POR_NOME de cada str.
+    """
+    with open(caminho, 'rb') as f:
+        amostra = f.read(1 << 20)
+    linhas = amostra.count(b'\n') or 1
+    media = max(1.0, len(amostra) / linhas)
+    return (media + CUSTO_POR_NOME) / media
+
+
+def _espalhar_em_baldes(entrada: str, pasta: str, tamanho_balde: int, aleatorio: random.Random) -> list:
+    """Distribui cada nome em um balde (arquivo temporário) escolhido ao acaso"""
+    num_baldes = min(MAX_BALDES, max(1, math.ceil(os.path.getsize(entrada) / tamanho_balde)))
+    caminhos = [os.path.join(pasta, f"balde_{i:05d}.txt") for i in range(num_baldes)]
+    arquivos = [open(c, 'w', encoding='utf-8') for c in caminhos]
+    try:
+        for nome in ler_nomes(entrada):
+            arquivos[aleatorio.randrange(num_baldes)].write(nome + '\n')
+    finally:
+        for arquivo in arquivos:
+            arquivo.close()
+    return caminhos
+
+
+def _juntar(caminhos: list, saida: str) -> None:
+    """Concatena os baldes no arquivo de saída"""
+    with open(saida, 'wb') as destino:
+        for caminho in caminhos:
+            with open(caminho, 'rb') as origem:
+                shutil.copyfileobj(origem, destino)
+
+
+def _embaralhar_balde(caminho: str, semente: int, tamanho_balde: int) -> str:
+    """
+    Embaralha um balde e o regrava no mesmo arquivo.
+
+    Se o balde ainda for maior que tamanho_balde (em disco), ele é espalhado
+    de novo em sub-baldes, em vez de abrir baldes demais de uma vez na
+    primeira passada.
+    """
+    tamanho = os.path.getsize(caminho)
+    if tamanho > tamanho_balde:
+        aleatorio = random.Random(semente)
+        pasta = tempfile.mkdtemp(prefix='balde_', dir=os.path.dirname(caminho))
+        try:
+            caminhos = _espalhar_em_baldes(caminho, pasta, tamanho_balde, aleatorio)
+            # Só continua dividindo se a passada realmente diminuiu os baldes
+            # (um único nome maior que a memória nunca se divide)
+            if max(os.path.getsize(c) for c in caminhos) < tamanho:
+                for sub_balde in caminhos:
+                    _embaralhar_balde(sub_balde, aleatorio.getrandbits(64), tamanho_balde)
+                _juntar(caminhos, caminho)
+                return caminho
+        finally:
+            shutil.rmtree(pasta, ignore_errors=True)
+
+    with open(caminho, encoding='utf-8') as f:
+        nomes = f.readlines()
+    random.Random(semente).shuffle(nomes)
+    with open(caminho, 'w', encoding='utf-8') as f:
+        f.writelines(nomes)
+    return caminho
+
+
+def embaralhar_arquivo(entrada: str, saida: str, semente: int = None,
+                       memoria: int = MEMORIA_BALDE, processos: int = 1) -> None:
+    """
+    Embaralha um arquivo de nomes maior que a memória (o shuffle do ex020.py em disco).
+
+    Cada nome vai para um balde aleatório; depois cada balde é embaralhado na
+    memória e os baldes são concatenados. O resultado é uma permutação uniforme.
+    No máximo MAX_BALDES arquivos ficam abertos por vez: baldes que continuam
+    grandes demais são divididos de novo.
+
+    Um nome ocupa bem mais memória do que em disco (veja _fator_memoria), por
+    isso o tamanho dos baldes em disco é a memória dividida por esse fator.
+
+    Args:
+        entrada: Arquivo com um nome por linha
+        saida: Arquivo onde a nova ordem será gravada
+        semente: Semente do gerador aleatório, para resultados reproduzíveis
+        memoria: Memória aproximada (bytes) que cada processo usa por balde;
+            com N processos o total fica perto de N × memoria
+        processos: Quantidade de processos para embaralhar os baldes em paralelo
+
+    A mesma semente gera a mesma ordem, com qualquer quantidade de processos.
+    """
+    aleatorio = random.Random(semente)
+    tamanho_balde = max(1, int(memoria / _fator_memoria(entrada)))
+    pasta = tempfile.mkdtemp(prefix='sorteio_', dir=os.path.dirname(os.path.abspath(saida)))
+    try:
+        caminhos = _espalhar_em_baldes(entrada, pasta, tamanho_balde, aleatorio)
+        # Cada balde tem semente própria, derivada da principal
+        sementes = [aleatorio.getrandbits(64) for _ in caminhos]
+        tamanhos = [tamanho_balde] * len(caminhos)
+
+        if processos > 1 and len(caminhos) > 1:
+            with ProcessPoolExecutor(max_workers=processos) as executor:
+                list(executor.map(_embaralhar_balde, caminhos, sementes, tamanhos))
+        else:
+            for caminho, semente_balde in zip(caminhos, sementes):
+                _embaralhar_balde(caminho, semente_balde, tamanho_balde)
+
+        _juntar(caminhos, saida)
+    finally:
+        shutil.rmtree(pasta, ignore_errors=True)
+
+
+def _medir(funcao, *args, **kwargs) -> Tuple[float, int]:
+    """Retorna o tempo (s) e o pico de memória Python (bytes) de uma chamada"""
+    inicio = time.perf_counter()
+    funcao(*args, **kwargs)
+    tempo = time.perf_counter() - inicio
+
+    # Segunda execução só para medir memória, pois o tracemalloc deixa tudo mais lento
+    tracemalloc.start()
+    funcao(*args, **kwargs)
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return tempo, pico
+
+
+def _pico_filhos() -> Optional[int]:
+    """Maior uso de memória (RSS, bytes) entre os processos filhos já encerrados, se disponível"""
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    # No Linux o valor vem em KB, no macOS em bytes
+    return pico if sys.platform == 'darwin' else pico * 1024
+
+
+def benchmark(quantidade: int = 10_000_000, k: int = 10, processos: int = None) -> None:
+    """Mede tempo e memória do sorteio e do embaralhamento com um arquivo de nomes gerado"""
+    processos = processos or os.cpu_count() or 1
+    pasta = tempfile.mkdtemp(prefix='benchmark_sorteio_')
+    try:
+        entrada = os.path.join(pasta, 'nomes.txt')
+        saida = os.path.join(pasta, 'embaralhado.txt')
+        with open(entrada, 'w', encoding='utf-8') as f:
+            for i in range(quantidade):
+                f.write(f"Aluno {i:08d}\n")
+        tamanho = os.path.getsize(entrada)
+        # Memória de 1/8 do arquivo, para exercitar o embaralhamento em disco
+        memoria = max(1, tamanho // 8)
+
+        print('Benchmark com {} nomes ({:.1f} MB)'.format(quantidade, tamanho / 1e6))
+        medicoes = [
+            ('Sorteio de {} nomes'.format(k),
+             lambda: sortear(ler_nomes(entrada), k, semente=1), False),
+            ('Embaralhamento (1 processo)',
+             lambda: embaralhar_arquivo(entrada, saida, semente=1, memoria=memoria), False),
+            ('Embaralhamento ({} processos)'.format(processos),
+             lambda: embaralhar_arquivo(entrada, saida, semente=1, memoria=memoria, processos=processos),
+             True),
+        ]
+        # O tracemalloc só enxerga o processo principal; os processos filhos
+        # são medidos pelo RSS máximo informado pelo sistema
+        print('{:<32} {:>10} {:>14} {:>14}'.format('', 'tempo', 'pico principal', 'pico filhos'))
+        for descricao, funcao, usa_filhos in medicoes:
+            tempo, pico = _medir(funcao)
+            pico_filhos = _pico_filhos() if usa_filhos else None
+            filhos = '{:.1f} MB'.format(pico_filhos / 1e6) if pico_filhos is not None else 'n/a'
+            print('{:<32} {:>8.2f} s {:>11.1f} MB {:>14}'.format(descricao, tempo, pico / 1e6, filhos))
+    finally:
+        shutil.rmtree(pasta, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sorteio e embaralhamento de listas grandes de nomes")
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p_sortear = sub.add_parser('sortear', help="Sorteia k nomes de um arquivo")
+    p_sortear.add_argument('entrada')
+    p_sortear.add_argument('-k', type=int, default=1)
+    p_sortear.add_argument('--semente', type=int)
+
+    p_embaralhar = sub.add_parser('embaralhar', help="Embaralha um arquivo de nomes")
+    p_embaralhar.add_argument('entrada')
+    p_embaralhar.add_argument('saida')
+    p_embaralhar.add_argument('--semente', type=int)
+    p_embaralhar.add_argument('--memoria', type=int, default=MEMORIA_BALDE, help="Memória (bytes) por processo ao embaralhar cada balde")
+    p_embaralhar.add_argument('--processos', type=int, default=1)
+
+    p_benchmark = sub.add_parser('benchmark', help="Mede tempo e memória com nomes gerados")
+    p_benchmark.add_argument('--quantidade', type=int, default=10_000_000)
+    p_benchmark.add_argument('-k', type=int, default=10)
+    p_benchmark.add_argument('--processos', type=int)
+
+    args = parser.parse_args()
+    if args.comando == 'sortear':
+        escolhidos = sortear(ler_nomes(args.entrada), args.k, args.semente)
+        print('Os alunos escolhidos foram {}'.format(', '.join(escolhidos)))
+    elif args.comando == 'embaralhar':
+        embaralhar_arquivo(args.entrada, args.saida, args.semente, args.memoria, args.processos)
+        print('A nova ordem foi gravada em {}'.format(args.saida))
+    else:
+        benchmark(args.quantidade, args.k, args.processos)